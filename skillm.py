@@ -20,38 +20,42 @@ import re
 import shutil
 import subprocess
 import sys
-from dataclasses import dataclass, field
+from functools import partial
+from operator import attrgetter
 
 if sys.platform == "win32":
     import ctypes
 from pathlib import Path
 from urllib.parse import urlparse
 
-try:
-    import argcomplete
-except ImportError:
-    argcomplete = None
-
 _HOME: Path = Path.home()
 SKILLS_DIR: Path = _HOME / ".agents" / "skills"
 LIBRARY_DIR: Path = _HOME / ".agents" / "_library"
 ROUTER_DIR: Path = SKILLS_DIR / "_router"
 ROUTER_FILE: Path = ROUTER_DIR / "SKILL.md"
+SCAN_JOBS: int = 1  # threads for top-level skill group scans (--jobs); 1 = serial
+
+IGNORED_DIRS = frozenset(
+    {
+        "_router",
+        "_dev",
+        "_library",
+        ".git",
+        "__pycache__",
+        "node_modules",
+        ".venv",
+        "venv",
+        ".hatch",
+    }
+)
 
-IGNORED_DIRS = {
-    "_router",
-    "_dev",
-    "_library",
-    ".git",
-    "__pycache__",
-    "node_modules",
-    ".venv",
-    "venv",
-    ".hatch",
-}
-
-HELPER_DIRS = {"scripts", "references", "assets"}
+HELPER_DIRS = frozenset({"scripts", "references", "assets"})
+_FRONTMATTER_END_RE = re.compile(rb"\n---[ \t]*\r?\n")
+_HEAD_CHUNK = 8192  # bytes read at a time when looking for the frontmatter end
 CHARS_PER_TOKEN = 4  # rough estimate for English text
+# Lives in SKILLS_DIR.parent (next to _library): never inside agent-visible dirs
+_PARSE_CACHE_NAME = ".skillm_parse_cache.json"
+_PARSE_CACHE_VERSION = 1  # bump when parse_frontmatter output changes
 
 # Relative paths from a base dir (home for global, project root for local).
 # Used for project-level detection and as fallback for global detection.
@@ -102,36 +106,170 @@ log = logging.getLogger(__name__)
 # --- Data ---
 
 
-@dataclass
+# Plain slotted class: dataclasses pulls in inspect, a noticeable share of startup.
 class Skill:
-    name: str
-    path: Path
-    description: str | None = None
-    source: str = "local"
-    helpers: list[str] = field(default_factory=list)
-    frontmatter: dict[str, str] = field(default_factory=dict)
+    __slots__ = ("description", "frontmatter", "helpers", "name", "path", "source")
+
+    def __init__(
+        self,
+        name: str,
+        path: Path,
+        description: str | None = None,
+        source: str = "local",
+        helpers: list[str] | None = None,
+        frontmatter: dict[str, str] | None = None,
+    ) -> None:
+        self.name = name
+        self.path = path
+        self.description = description
+        self.source = source
+        self.helpers = helpers if helpers is not None else []
+        self.frontmatter = frontmatter if frontmatter is not None else {}
+
+    def _fields(self) -> tuple:
+        return (
+            self.name,
+            self.path,
+            self.description,
+            self.source,
+            self.helpers,
+            self.frontmatter,
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Skill):
+            return NotImplemented
+        return self._fields() == other._fields()
+
+    def __repr__(self) -> str:
+        return (
+            f"Skill(name={self.name!r}, path={self.path!r}, "
+            f"description={self.description!r}, source={self.source!r}, "
+            f"helpers={self.helpers!r}, frontmatter={self.frontmatter!r})"
+        )
 
 
 # --- Core ---
 
 
 def parse_frontmatter(content: str) -> dict[str, str]:
-    match = re.match(r"^---\s*\n(.*?)\n---", content, re.DOTALL)
-    if not match:
+    """Parse the leading ---/--- block into flat key/value pairs.
+
+    Linear line scan: no regex, so malformed input cannot backtrack.
+    Returns {} when the block is missing or never closed.
+    """
+    if not content.startswith("---"):
+        return {}
+    end = content.find("\n")
+    if end == -1 or content[3:end].strip(" \t\r"):
         return {}
     fm: dict[str, str] = {}
-    for line in match.group(1).splitlines():
-        if ":" in line:
-            key, _, value = line.partition(":")
-            fm[key.strip()] = value.strip()
-    return fm
+    pos = end + 1
+    size = len(content)
+    while pos < size:
+        end = content.find("\n", pos)
+        if end == -1:
+            end = size
+        # Slice key/value straight from content; a line with ":" cannot close
+        colon = content.find(":", pos, end)
+        if colon != -1:
+            fm[content[pos:colon].strip()] = content[colon + 1 : end].strip()
+        elif content[pos:end].rstrip() == "---":
+            return fm
+        pos = end + 1
+    return {}
+
+
+def _read_frontmatter_head(skill_file: Path) -> str:
+    """Read SKILL.md only up to the end of its frontmatter block."""
+    with skill_file.open("rb") as f:
+        head = bytearray(f.read(_HEAD_CHUNK))
+        if head.startswith(b"---"):
+            start = 3
+            while not _FRONTMATTER_END_RE.search(head, start):
+                chunk = f.read(_HEAD_CHUNK)
+                if not chunk:
+                    break
+                # Rescan only new bytes plus a small overlap for a split delimiter
+                start = max(3, len(head) - 8)
+                head += chunk
+    return head.decode("utf-8", "replace")
+
+
+class _ParseCache:
+    """On-disk frontmatter cache for SKILL.md files, validated by (mtime_ns, size).
+
+    Entries not looked up during a scan are dropped on save.
+    """
 
+    def __init__(self, file: Path) -> None:
+        import json  # deferred: keeps it off the startup path of every command
 
-def find_skill(dir_path: Path) -> Skill | None:
-    skill_file = dir_path / "SKILL.md"
-    if not skill_file.is_file():
+        self.file = file
+        self.old: dict[str, list] = {}
+        self.new: dict[str, list] = {}
+        try:
+            data = json.loads(file.read_bytes())
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict) and data.get("version") == _PARSE_CACHE_VERSION:
+            skills = data.get("skills")
+            if isinstance(skills, dict):
+                self.old = skills
+
+    def frontmatter(self, skill_entry: os.DirEntry[str]) -> dict[str, str]:
+        st = skill_entry.stat()
+        stamp = [st.st_mtime_ns, st.st_size]
+        hit = self.old.get(skill_entry.path)
+        # Anything not shaped [mtime_ns, size, {str: str}] is a miss, never a crash
+        if (
+            isinstance(hit, list)
+            and len(hit) == 3
+            and hit[:2] == stamp
+            and isinstance(hit[2], dict)
+            and all(isinstance(v, str) for v in hit[2].values())
+        ):
+            fm = hit[2]
+        else:
+            fm = parse_frontmatter(_read_frontmatter_head(Path(skill_entry.path)))
+        self.new[skill_entry.path] = [*stamp, fm]
+        return fm
+
+    def save(self) -> None:
+        if self.new == self.old:
+            return
+        import json
+
+        data = {"version": _PARSE_CACHE_VERSION, "skills": self.new}
+        tmp = self.file.with_name(f"{self.file.name}.{os.getpid()}.tmp")
+        try:
+            tmp.write_bytes(json.dumps(data).encode("utf-8"))
+            os.replace(tmp, self.file)
+        except OSError as e:
+            log.debug("Could not write parse cache %s: %s", self.file, e)
+            tmp.unlink(missing_ok=True)
+
+
+def _list_dir(path: str | Path) -> list[os.DirEntry[str]]:
+    """List directory entries once; missing or non-directory paths yield []."""
+    try:
+        with os.scandir(path) as it:
+            return list(it)
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+
+
+def _skill_from_entries(
+    dir_path: Path, entries: list[os.DirEntry[str]], cache: _ParseCache | None = None
+) -> Skill | None:
+    """Build a Skill from an already-listed directory, or None if no SKILL.md."""
+    skill_entry = next((e for e in entries if e.name == "SKILL.md"), None)
+    if skill_entry is None or not skill_entry.is_file():
         return None
-    fm = parse_frontmatter(skill_file.read_text(encoding="utf-8"))
+    if cache is not None:
+        fm = cache.frontmatter(skill_entry)
+    else:
+        fm = parse_frontmatter(_read_frontmatter_head(Path(skill_entry.path)))
     name = fm.get("name") or dir_path.name
     desc = fm.get("description")
     if desc and desc.startswith('"') and desc.endswith('"'):
@@ -141,7 +279,7 @@ def find_skill(dir_path: Path) -> Skill | None:
         source = "library"
     except ValueError:
         source = "local"
-    helpers = sorted(h for h in HELPER_DIRS if (dir_path / h).is_dir())
+    helpers = sorted(e.name for e in entries if e.name in HELPER_DIRS and e.is_dir())
     return Skill(
         name=name,
         path=dir_path,
@@ -152,19 +290,61 @@ def find_skill(dir_path: Path) -> Skill | None:
     )
 
 
-def scan_tree(base: Path, depth: int = 0, max_depth: int = 3) -> list[Skill]:
-    if depth > max_depth or not base.is_dir():
-        return []
-    skills: list[Skill] = []
-    for item in sorted(base.iterdir()):
-        if not item.is_dir() or item.name in IGNORED_DIRS or item.name.startswith("."):
+def find_skill(dir_path: Path) -> Skill | None:
+    return _skill_from_entries(dir_path, _list_dir(dir_path))
+
+
+def _scan_entries(
+    entries: list[os.DirEntry[str]],
+    depth: int,
+    max_depth: int,
+    jobs: int = 1,
+    cache: _ParseCache | None = None,
+) -> list[Skill]:
+    # Per-entry results in listing order; groups fill their slot after recursion
+    found: list[list[Skill]] = []
+    groups: list[tuple[int, list[os.DirEntry[str]]]] = []
+    for entry in sorted(entries, key=attrgetter("name")):
+        name = entry.name  # never empty for scandir entries
+        if name in IGNORED_DIRS or name[0] == ".":
             continue
-        skill = find_skill(item)
+        if not entry.is_dir():
+            continue
+        # One listing per dir serves SKILL.md lookup, helpers, and recursion
+        sub = _list_dir(entry.path)
+        skill = _skill_from_entries(Path(entry.path), sub, cache)
         if skill:
-            skills.append(skill)
-        else:
-            skills.extend(scan_tree(item, depth + 1, max_depth))
-    return skills
+            found.append([skill])
+        elif depth < max_depth:
+            groups.append((len(found), sub))
+            found.append([])
+
+    scan_group = partial(
+        _scan_entries, depth=depth + 1, max_depth=max_depth, cache=cache
+    )
+    if jobs > 1 and len(groups) > 1:
+        # Opt-in: only pays off where I/O latency dominates (slow/network FS)
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=min(jobs, len(groups))) as ex:
+            results = ex.map(scan_group, [sub for _, sub in groups])
+            for (slot, _), result in zip(groups, results):
+                found[slot] = result
+    else:
+        for slot, sub in groups:
+            found[slot] = scan_group(sub)
+    return [s for part in found for s in part]
+
+
+def scan_tree(
+    base: Path,
+    depth: int = 0,
+    max_depth: int = 3,
+    cache: _ParseCache | None = None,
+) -> list[Skill]:
+    if depth > max_depth:
+        return []
+    return _scan_entries(_list_dir(base), depth, max_depth, jobs=SCAN_JOBS, cache=cache)
 
 
 def _skill_priority(skill: Skill) -> tuple[int, int]:
@@ -179,28 +359,48 @@ def _skill_priority(skill: Skill) -> tuple[int, int]:
     return (source_rank, -size)
 
 
-def _scan_all_raw() -> list[Skill]:
-    """Scan both SKILLS_DIR and LIBRARY_DIR, no dedup."""
-    return scan_tree(SKILLS_DIR) + scan_tree(LIBRARY_DIR)
+def _scan_all_raw(save_cache: bool = False) -> list[Skill]:
+    """Scan both SKILLS_DIR and LIBRARY_DIR, no dedup.
+
+    The parse cache is always read; it is only written when save_cache is set,
+    so read-only commands stay free of side effects.
+    """
+    cache = _ParseCache(SKILLS_DIR.parent / _PARSE_CACHE_NAME)
+    skills = scan_tree(SKILLS_DIR, cache=cache) + scan_tree(LIBRARY_DIR, cache=cache)
+    # Never create SKILLS_DIR just to hold the cache
+    if save_cache and SKILLS_DIR.is_dir():
+        cache.save()
+    return skills
 
 
 def _dedup_skills(raw: list[Skill]) -> list[Skill]:
-    """Deduplicate skills by name, keeping the highest-priority one."""
-    groups: dict[str, list[Skill]] = {}
+    """Deduplicate skills by name, keeping the highest-priority one.
+
+    Returns the survivors sorted by name.
+    """
+    first: dict[str, Skill] = {}
+    # Rank only repeated names: _skill_priority stats SKILL.md
+    conflicts: dict[str, list[Skill]] = {}
     for s in raw:
-        groups.setdefault(s.name, []).append(s)
+        seen = first.setdefault(s.name, s)
+        if seen is not s:
+            conflicts.setdefault(s.name, [seen]).append(s)
 
-    unique: list[Skill] = []
-    for name, copies in groups.items():
+    for name, copies in conflicts.items():
         copies.sort(key=_skill_priority)
-        unique.append(copies[0])
+        first[name] = copies[0]
         for dup in copies[1:]:
-            log.debug(f"Duplicate '{name}' at {dup.path}, shadowed by {copies[0].path}")
+            log.debug(
+                "Duplicate '%s' at %s, shadowed by %s", name, dup.path, copies[0].path
+            )
+    unique = list(first.values())
+    unique.sort(key=attrgetter("name"))
     return unique
 
 
-def scan_all() -> list[Skill]:
-    return _dedup_skills(_scan_all_raw())
+def scan_all(save_cache: bool = False) -> list[Skill]:
+    """Scan all sources and dedup; result is sorted by name for direct output."""
+    return _dedup_skills(_scan_all_raw(save_cache))
 
 
 def find_all_by_name(name: str) -> list[Skill]:
@@ -309,6 +509,11 @@ def _is_link(path: Path) -> bool:
     return False
 
 
+def _is_link_entry(entry: os.DirEntry[str]) -> bool:
+    """DirEntry variant of _is_link, answered from the listing without a stat."""
+    return entry.is_symlink() or entry.is_junction()
+
+
 def _remove_link(link: Path) -> None:
     """Remove a symlink, junction, or copied directory."""
     if link.is_symlink():
@@ -342,7 +547,11 @@ def symlink_skill(link: Path, target: Path) -> bool:
 
 
 def home_short(p: Path) -> str:
-    return str(p).replace(str(_HOME), "~")
+    """Replace a leading home dir with '~' (prefix only, no substring scan)."""
+    path, home = str(p), str(_HOME)
+    if path == home or path.startswith(home + os.sep):
+        return "~" + path[len(home) :]
+    return path
 
 
 def _short_path(p: Path) -> str:
@@ -419,10 +628,10 @@ def _collect_installed_rows(
     # skill_name -> (agents, idle, active, source)
     merged: dict[str, tuple[list[str], int, int, str]] = {}
     for agent, sdir in sorted(detect_agents(base).items()):
-        if not sdir.is_dir():
-            continue
         links = sorted(
-            p for p in sdir.iterdir() if _is_link(p) and p.name not in IGNORED_DIRS
+            Path(e.path)
+            for e in _list_dir(sdir)
+            if e.name not in IGNORED_DIRS and _is_link_entry(e)
         )
         for link in links:
             name = link.name
@@ -513,18 +722,19 @@ def cmd_list(args: argparse.Namespace) -> int:
             print(f"No skills matching '{args.query}'.")
             return 0
 
-    w = max(max(len(s.name) for s in skills), 5)
-    print(
-        f"\n{'SKILL':<{w}}  {'SOURCE':<8}  {'IDLE_TK':>7}  {'ACTIVE_TK':>9}  DESCRIPTION"
-    )
-    print(f"{'-' * w}  {'-' * 8}  {'-' * 7}  {'-' * 9}  {'-' * 44}")
+    w = max(5, *(len(s.name) for s in skills))
+    # Column widths are fixed for the whole table: build the format spec once
+    row = f"{{:<{w}}}  {{:<8}}  {{:>7}}  {{:>9}}  {{}}".format
+    print("\n" + row("SKILL", "SOURCE", "IDLE_TK", "ACTIVE_TK", "DESCRIPTION"))
+    print(row("-" * w, "-" * 8, "-" * 7, "-" * 9, "-" * 44))
 
-    for s in sorted(skills, key=lambda s: s.name):
+    # Already sorted by name (_dedup_skills); the query filter keeps order
+    for s in skills:
         desc = s.description or "(no description)"
         if len(desc) > 72:
             desc = desc[:69] + "..."
         idle, active = estimate_tokens(s)
-        print(f"{s.name:<{w}}  {s.source:<8}  {idle:>7}  {active:>9}  {desc}")
+        print(row(s.name, s.source, idle, active, desc))
         if s.name in dupes:
             print(f"  ↳ --from: {', '.join(dupes[s.name])}")
 
@@ -567,11 +777,9 @@ def _find_installations(s: Skill) -> list[str]:
 
     for scope, base in scopes:
         for agent, sdir in sorted(detect_agents(base).items()):
-            if not sdir.is_dir():
-                continue
-            for link in sdir.iterdir():
-                if _is_link(link) and link.name not in IGNORED_DIRS:
-                    if link.resolve() == resolved:
+            for entry in _list_dir(sdir):
+                if entry.name not in IGNORED_DIRS and _is_link_entry(entry):
+                    if Path(entry.path).resolve() == resolved:
                         installations.append(f"{scope}/{agent}")
                         break
 
@@ -1016,9 +1224,9 @@ def cmd_update(args: argparse.Namespace) -> int:
             log.info("Library is empty")
             return 0
         dirs = sorted(
-            d
-            for d in LIBRARY_DIR.iterdir()
-            if d.is_dir() and not d.is_symlink() and (d / ".git").is_dir()
+            Path(e.path)
+            for e in _list_dir(LIBRARY_DIR)
+            if e.is_dir() and not e.is_symlink() and Path(e.path, ".git").is_dir()
         )
         if not dirs:
             log.info("No git-based skills in library")
@@ -1107,7 +1315,7 @@ def cmd_scan(args: argparse.Namespace) -> int:
 
 
 def cmd_router(args: argparse.Namespace) -> int:
-    skills = scan_all()
+    skills = scan_all(save_cache=not args.dry_run)
     if not skills:
         log.warning("No skills found")
         return 1
@@ -1121,8 +1329,8 @@ def cmd_router(args: argparse.Namespace) -> int:
         "# Skill Router",
         "",
     ]
-    for s in sorted(skills, key=lambda s: s.name):
-        lines.append(f"{s.name}: {home_short(s.path)}/")
+    # scan_all returns skills sorted by name
+    lines.extend(f"{s.name}: {home_short(s.path)}/" for s in skills)
     lines.append("")
     content = "\n".join(lines)
 
@@ -1131,7 +1339,7 @@ def cmd_router(args: argparse.Namespace) -> int:
         return 0
 
     ROUTER_DIR.mkdir(parents=True, exist_ok=True)
-    ROUTER_FILE.write_text(content, encoding="utf-8")
+    ROUTER_FILE.write_bytes(content.encode("utf-8"))
     log.info(f"Router: {ROUTER_FILE} ({len(skills)} skills)")
     return 0
 
@@ -1169,25 +1377,23 @@ def cmd_doctor(_args: argparse.Namespace) -> int:
         scopes.append(("project", root, ""))
     for scope, base, flag in scopes:
         for agent, sdir in sorted(detect_agents(base).items()):
-            if not sdir.is_dir():
-                continue
-            for link in sorted(sdir.iterdir()):
-                if _is_link(link) and not link.exists():
+            for entry in sorted(_list_dir(sdir), key=attrgetter("name")):
+                if _is_link_entry(entry) and not Path(entry.path).exists():
                     issues.append(
-                        f"broken link: {scope}/{agent}/{link.name}"
-                        f"  fix: skillm uninstall{flag} {link.name}"
+                        f"broken link: {scope}/{agent}/{entry.name}"
+                        f"  fix: skillm uninstall{flag} {entry.name}"
                     )
 
     # 4. Library dirs with no skills
-    if LIBRARY_DIR.is_dir():
-        for d in sorted(LIBRARY_DIR.iterdir()):
-            if not d.is_dir():
-                continue
-            sub = scan_tree(d, max_depth=2)
-            if not sub and not find_skill(d):
-                issues.append(
-                    f"empty library repo: {d.name}  fix: skillm remove {d.name}"
-                )
+    for d in sorted(_list_dir(LIBRARY_DIR), key=attrgetter("name")):
+        if not d.is_dir():
+            continue
+        sub = _list_dir(d.path)
+        # Single-skill repo: no need to scan its subtree
+        if any(e.name == "SKILL.md" and e.is_file() for e in sub):
+            continue
+        if not _scan_entries(sub, 0, 2):
+            issues.append(f"empty library repo: {d.name}  fix: skillm remove {d.name}")
 
     # Report
     if issues:
@@ -1241,6 +1447,13 @@ Infrastructure:
         "-V", "--version", action="version", version=f"%(prog)s {__version__}"
     )
     parser.add_argument("-v", "--verbose", action="store_true", help="verbose output")
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="threads for scanning skill groups (default: 1, for slow/network FS)",
+    )
     parser.add_argument(
         "--skills-dir",
         type=Path,
@@ -1321,8 +1534,14 @@ Infrastructure:
 
     sub.add_parser("doctor", help="diagnose issues")
 
-    if argcomplete:
-        argcomplete.autocomplete(parser)
+    # argcomplete sets _ARGCOMPLETE when completing; skip the import otherwise
+    if "_ARGCOMPLETE" in os.environ:
+        try:
+            import argcomplete
+        except ImportError:
+            pass
+        else:
+            argcomplete.autocomplete(parser)
 
     args = parser.parse_args()
 
@@ -1337,6 +1556,9 @@ Infrastructure:
         ROUTER_DIR = SKILLS_DIR / "_router"
         ROUTER_FILE = ROUTER_DIR / "SKILL.md"
 
+    global SCAN_JOBS
+    SCAN_JOBS = max(1, args.jobs)
+
     logging.basicConfig(
         level=logging.DEBUG if args.verbose else logging.INFO,
         format="%(levelname)s: %(message)s",
@@ -1,9 +1,11 @@
 """Tests for skillm.py."""
 
 import argparse
+import json
 import shutil
 import subprocess
 import sys
+import time
 from pathlib import Path
 from unittest.mock import patch
 
@@ -118,6 +120,19 @@ class TestParseFrontmatter:
         fm = skillm.parse_frontmatter(content)
         assert fm == {"name": "x"}
 
+    def test_crlf_line_endings(self):
+        content = "---\r\nname: x\r\ndescription: y\r\n---\r\nBody"
+        fm = skillm.parse_frontmatter(content)
+        assert fm == {"name": "x", "description": "y"}
+
+    def test_four_dash_line_does_not_close(self):
+        content = "---\nname: x\n----\ndescription: y\n---\n"
+        fm = skillm.parse_frontmatter(content)
+        assert fm == {"name": "x", "description": "y"}
+
+    def test_unterminated(self):
+        assert skillm.parse_frontmatter("---\nname: x\nBody") == {}
+
 
 class TestClassifySource:
     def test_https_url(self):
@@ -291,6 +306,15 @@ class TestHomeShort:
         result = skillm.home_short(Path("/tmp/foo"))
         assert result == "/tmp/foo"
 
+    def test_home_only_replaced_as_prefix(self):
+        home = Path.home()
+        nested = Path("/backup") / home.relative_to(home.anchor) / "foo"
+        assert skillm.home_short(nested) == str(nested)
+
+    def test_sibling_dir_with_home_prefix(self):
+        sibling = Path(str(Path.home()) + "-old") / "foo"
+        assert skillm.home_short(sibling) == str(sibling)
+
 
 # ============================================================
 # Unit tests: filesystem functions
@@ -364,6 +388,42 @@ class TestFindSkill:
         assert s is not None
         assert s.description == "quoted desc"
 
+    def test_frontmatter_longer_than_read_chunk(self, tmp_path, skills_env):
+        long_desc = "x" * (skillm._HEAD_CHUNK * 2)
+        skill_dir = make_skill(
+            tmp_path / "big", name="big", description=long_desc, extras={"k": "v"}
+        )
+        s = skillm.find_skill(skill_dir)
+        assert s is not None
+        assert s.description == long_desc
+        assert s.frontmatter["k"] == "v"
+
+    def test_unclosed_frontmatter_large_file_is_linear(self, tmp_path, skills_env):
+        skill_dir = tmp_path / "huge"
+        skill_dir.mkdir()
+        (skill_dir / "SKILL.md").write_bytes(b"---\n" + b"x" * (16 * 1024 * 1024))
+
+        start = time.perf_counter()
+        s = skillm.find_skill(skill_dir)
+        assert time.perf_counter() - start < 3
+        assert s is not None
+        assert s.name == "huge"
+        assert s.frontmatter == {}
+
+    def test_delimiter_split_across_chunks(self, tmp_path, skills_env):
+        skill_dir = tmp_path / "split"
+        skill_dir.mkdir()
+        head = "---\nname: split\nk: "
+        # Closing "\n---\n" starts 2 bytes before the first chunk boundary
+        pad = "v" * (skillm._HEAD_CHUNK - 2 - len(head))
+        content = f"{head}{pad}\n---\nbody"
+        assert content.index("\n---\n") == skillm._HEAD_CHUNK - 2
+        (skill_dir / "SKILL.md").write_text(content, encoding="utf-8")
+
+        s = skillm.find_skill(skill_dir)
+        assert s is not None
+        assert s.frontmatter["name"] == "split"
+
     def test_detects_helpers(self, tmp_path, skills_env):
         skill_dir = make_skill(tmp_path / "h", name="h", description="h")
         (skill_dir / "scripts").mkdir()
@@ -372,6 +432,17 @@ class TestFindSkill:
         assert s is not None
         assert s.helpers == ["references", "scripts"]
 
+    def test_helper_name_must_be_dir(self, tmp_path, skills_env):
+        skill_dir = make_skill(tmp_path / "h", name="h", description="h")
+        (skill_dir / "scripts").write_text("not a dir", encoding="utf-8")
+        (skill_dir / "other").mkdir()
+        assets = tmp_path / "shared-assets"
+        assets.mkdir()
+        (skill_dir / "assets").symlink_to(assets, target_is_directory=True)
+        s = skillm.find_skill(skill_dir)
+        assert s is not None
+        assert s.helpers == ["assets"]
+
     def test_no_helpers(self, tmp_path, skills_env):
         skill_dir = make_skill(tmp_path / "h", name="h", description="h")
         s = skillm.find_skill(skill_dir)
@@ -386,6 +457,26 @@ class TestFindSkill:
         assert s.source == "library"
 
 
+class TestSkill:
+    def test_value_equality(self):
+        a = skillm.Skill(name="a", path=Path("/x/a"), helpers=["scripts"])
+        b = skillm.Skill(name="a", path=Path("/x/a"), helpers=["scripts"])
+        assert a == b
+        assert a != skillm.Skill(name="a", path=Path("/x/a"))
+
+    def test_unhashable(self):
+        with pytest.raises(TypeError):
+            hash(skillm.Skill(name="a", path=Path("/x/a")))
+
+    def test_repr_includes_all_fields(self):
+        s = skillm.Skill(
+            name="a", path=Path("/x/a"), description="d", frontmatter={"k": "v"}
+        )
+        r = repr(s)
+        for part in ("name='a'", "description='d'", "helpers=[]", "{'k': 'v'}"):
+            assert part in r
+
+
 class TestScanTree:
     def test_finds_flat_skills(self, skills_env):
         sd = skills_env["skills_dir"]
@@ -448,6 +539,31 @@ class TestScanTree:
         result = skillm.scan_tree(Path("/nonexistent"))
         assert result == []
 
+    def test_follows_symlinked_repo(self, skills_env, tmp_path):
+        """Linked skill repos (skillm add ./path) are symlinks in SKILLS_DIR."""
+        sd = skills_env["skills_dir"]
+        repo = tmp_path / "my-repo"
+        make_skill(repo / "linked", name="linked", description="linked")
+        (sd / "my-repo").symlink_to(repo, target_is_directory=True)
+
+        result = skillm.scan_tree(sd)
+        assert [s.name for s in result] == ["linked"]
+        assert result[0].path == sd / "my-repo" / "linked"
+
+    def test_parallel_groups_keep_order(self, skills_env):
+        sd = skills_env["skills_dir"]
+        make_skill(sd / "0-flat", name="flat", description="flat")
+        expected = ["flat"]
+        for i in range(5):
+            for j in range(2):
+                make_skill(sd / f"pack{i}" / f"s{j}", name=f"p{i}s{j}", description="x")
+                expected.append(f"p{i}s{j}")
+
+        with patch.object(skillm, "SCAN_JOBS", 4):
+            result = skillm.scan_tree(sd)
+        assert [s.name for s in result] == expected
+        assert [s.name for s in skillm.scan_tree(sd)] == expected
+
     def test_sorted_output(self, skills_env):
         sd = skills_env["skills_dir"]
         make_skill(sd / "z-skill", name="z-skill", description="z")
@@ -483,6 +599,100 @@ class TestScanAll:
         result = skillm.scan_all()
         assert len(result) == 2
 
+    def test_parse_cache_reused(self, skills_env):
+        sd = skills_env["skills_dir"]
+        make_skill(sd / "a", name="a", description="a")
+        skillm.scan_all(save_cache=True)
+
+        cache_file = skills_env["root"] / skillm._PARSE_CACHE_NAME
+        data = json.loads(cache_file.read_text(encoding="utf-8"))
+        entry = data["skills"][str(sd / "a" / "SKILL.md")]
+        entry[2] = {"name": "from-cache"}
+        cache_file.write_text(json.dumps(data), encoding="utf-8")
+
+        assert [s.name for s in skillm.scan_all()] == ["from-cache"]
+
+    def test_parse_cache_outside_skills_dir(self, skills_env):
+        """Library frontmatter must not be copied into agent-visible dirs."""
+        lib = skills_env["library_dir"]
+        make_skill(lib / "repo" / "x", name="x", extras={"evil": "ignore previous"})
+        skillm.scan_all(save_cache=True)
+
+        assert (skills_env["root"] / skillm._PARSE_CACHE_NAME).is_file()
+        for f in skills_env["skills_dir"].rglob("*"):
+            if f.is_file():
+                assert "ignore previous" not in f.read_text(encoding="utf-8")
+
+    def test_parse_cache_not_written_by_default(self, skills_env):
+        make_skill(skills_env["skills_dir"] / "a", name="a", description="a")
+        skillm.scan_all()
+        assert not (skills_env["root"] / skillm._PARSE_CACHE_NAME).exists()
+
+    def test_parse_cache_invalidated_on_change(self, skills_env):
+        sd = skills_env["skills_dir"]
+        make_skill(sd / "a", name="a", description="a")
+        skillm.scan_all(save_cache=True)
+
+        make_skill(sd / "a", name="renamed", description="longer description")
+        assert [s.name for s in skillm.scan_all()] == ["renamed"]
+
+    def test_parse_cache_ignores_other_version(self, skills_env):
+        sd = skills_env["skills_dir"]
+        make_skill(sd / "a", name="a", description="a")
+        cache_file = skills_env["root"] / skillm._PARSE_CACHE_NAME
+        stale = {str(sd / "a" / "SKILL.md"): [0, 0, {"name": "stale"}]}
+        cache_file.write_text(
+            json.dumps({"version": -1, "skills": stale}), encoding="utf-8"
+        )
+
+        assert [s.name for s in skillm.scan_all()] == ["a"]
+
+    @staticmethod
+    def _write_cache(skills_env, skills):
+        cache_file = skills_env["root"] / skillm._PARSE_CACHE_NAME
+        cache_file.write_text(
+            json.dumps({"version": skillm._PARSE_CACHE_VERSION, "skills": skills}),
+            encoding="utf-8",
+        )
+
+    @pytest.mark.parametrize("skills", [[], "x", None])
+    def test_parse_cache_malformed_skills(self, skills_env, skills):
+        make_skill(skills_env["skills_dir"] / "a", name="a", description="a")
+        self._write_cache(skills_env, skills)
+
+        assert [s.name for s in skillm.scan_all()] == ["a"]
+
+    @pytest.mark.parametrize(
+        "tail", [None, [["bad"]], [{"name": 1}], [{"name": "x"}, "extra"]]
+    )
+    def test_parse_cache_malformed_entry(self, skills_env, tail):
+        skill_md = make_skill(skills_env["skills_dir"] / "a", name="a") / "SKILL.md"
+        st = skill_md.stat()
+        # Correct stamp, so only the entry's shape can make it a miss
+        entry = {"name": "bad"} if tail is None else [st.st_mtime_ns, st.st_size, *tail]
+        self._write_cache(skills_env, {str(skill_md): entry})
+
+        assert [s.name for s in skillm.scan_all()] == ["a"]
+
+    def test_unique_names_skip_priority(self, skills_env):
+        sd = skills_env["skills_dir"]
+        make_skill(sd / "a", name="a", description="a")
+        make_skill(sd / "b", name="b", description="b")
+
+        with patch.object(
+            skillm, "_skill_priority", wraps=skillm._skill_priority
+        ) as prio:
+            skillm.scan_all()
+        prio.assert_not_called()
+
+    def test_sorted_by_name(self, skills_env):
+        sd = skills_env["skills_dir"]
+        make_skill(sd / "a-pack" / "zeta", name="zeta", description="z")
+        make_skill(sd / "b-pack" / "alpha", name="alpha", description="a")
+
+        result = skillm.scan_all()
+        assert [s.name for s in result] == ["alpha", "zeta"]
+
 
 class TestDetectAgents:
     def test_detects_existing(self, tmp_path):
@@ -1622,6 +1832,21 @@ class TestCmdRouter:
         assert "alpha:" in content
         assert "name: router" in content
 
+    def test_dry_run_writes_nothing(self, skills_env, capsys):
+        make_skill(skills_env["skills_dir"] / "alpha", name="alpha", description="A")
+
+        args = argparse.Namespace(command="router", dry_run=True, verbose=False)
+        assert skillm.cmd_router(args) == 0
+        assert not skills_env["router_dir"].exists()
+        assert not (skills_env["root"] / skillm._PARSE_CACHE_NAME).exists()
+
+    def test_write_saves_parse_cache(self, skills_env):
+        make_skill(skills_env["skills_dir"] / "alpha", name="alpha", description="A")
+
+        args = argparse.Namespace(command="router", dry_run=False, verbose=False)
+        assert skillm.cmd_router(args) == 0
+        assert (skills_env["root"] / skillm._PARSE_CACHE_NAME).is_file()
+
     def test_empty_skills(self, skills_env):
         args = argparse.Namespace(command="router", dry_run=False, verbose=False)
         ret = skillm.cmd_router(args)
@@ -1637,6 +1862,17 @@ class TestCmdRouter:
         out = capsys.readouterr().out
         assert out.index("a-skill") < out.index("z-skill")
 
+    def test_router_sorted_across_groups(self, skills_env, capsys):
+        """Order follows skill names, not the group dirs they live in."""
+        sd = skills_env["skills_dir"]
+        make_skill(sd / "a-pack" / "zeta", name="zeta", description="z")
+        make_skill(sd / "b-pack" / "alpha", name="alpha", description="a")
+
+        args = argparse.Namespace(command="router", dry_run=True, verbose=False)
+        skillm.cmd_router(args)
+        out = capsys.readouterr().out
+        assert out.index("alpha:") < out.index("zeta:")
+
 
 class TestCmdDoctor:
     def _run_doctor(self, skills_env, home=None, project=None):
@@ -1729,6 +1965,14 @@ class TestCmdDoctor:
         assert "empty library repo" in out
         assert "skillm remove empty-repo" in out
 
+    def test_single_skill_library_repo_not_empty(self, skills_env, capsys):
+        lib = skills_env["library_dir"]
+        make_skill(lib / "solo-repo", name="solo", description="solo")
+
+        ret = self._run_doctor(skills_env)
+        assert ret == 0
+        assert "empty library repo" not in capsys.readouterr().out
+
     def test_multiple_issues(self, skills_env, capsys):
         sd = skills_env["skills_dir"]
         s = sd / "no-desc"